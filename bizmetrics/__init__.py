@@ -4,5 +4,7 @@ BizMetrics CLI - Business Intelligence Metrics Analysis Tool
 A professional CLI for fetching, analyzing, and exporting business metrics.
 """
 
-__version__ = "0.1.0"
+from bizmetrics._version import __version__
+
+__all__ = ["__version__"]
 __author__ = "Gabriel Sbrana"
@@ -1,10 +1,40 @@
 """Entry point for the BizMetrics CLI."""
 
-from bizmetrics.cli import app
+import sys
+
+from bizmetrics._version import __version__
+
+# Static copy of the top-level help so `bizmetrics --help` does not have to
+# import Typer/Click/Rich. Keep in sync with the commands in bizmetrics.cli.
+HELP_TEXT = """\
+Usage: bizmetrics [OPTIONS] COMMAND [ARGS]...
+
+  🚀 Business Intelligence Metrics CLI - Fetch, analyze, and export your metrics
+
+Options:
+  -v, --version  Show version and exit
+  --help         Show this message and exit.
+
+Commands:
+  fetch   Fetch metrics from a data connector.
+  export  Export cached metrics to a file.
+  cache   Manage the metrics cache.
+  config  Manage configuration.
+"""
 
 
 def main() -> None:
     """Main entry point for the CLI."""
+    args = sys.argv[1:]
+    if args in (["--version"], ["-v"]):
+        print(f"BizMetrics CLI version {__version__}")
+        return
+    if args == ["--help"]:
+        print(HELP_TEXT, end="")
+        return
+
+    from bizmetrics.cli import app
+
     app()
 
 
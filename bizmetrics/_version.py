@@ -0,0 +1,3 @@
+"""Package version, kept import-free for the CLI fast path."""
+
+__version__ = "0.1.0"
@@ -1,31 +1,43 @@
 """CLI commands for BizMetrics using Typer."""
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from bizmetrics import __version__
 from bizmetrics.config import get_settings
-from bizmetrics.connectors.base import BaseConnector
-from bizmetrics.connectors.demo import DemoConnector
-from bizmetrics.db import Database
-from bizmetrics.exporters.csv_exporter import CSVExporter
-from bizmetrics.exporters.excel_exporter import ExcelExporter
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from bizmetrics.connectors.base import BaseConnector
 
 app = typer.Typer(
     name="bizmetrics",
     help="🚀 Business Intelligence Metrics CLI - Fetch, analyze, and export your metrics",
     add_completion=False,
 )
-console = Console()
+
+# Heavy modules (rich tables, SQLite, exporters) are imported inside the
+# commands that need them so `--help` and `--version` stay fast.
+_console: "Console | None" = None
+
+
+def _get_console() -> "Console":
+    """Get the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
-        console.print(f"[bold blue]BizMetrics CLI[/bold blue] version [green]{__version__}[/green]")
+        _get_console().print(f"[bold blue]BizMetrics CLI[/bold blue] version [green]{__version__}[/green]")
         raise typer.Exit()
 
 
@@ -52,11 +64,15 @@ def fetch(
     cache: bool = typer.Option(True, "--cache/--no-cache", help="Use cache for results"),
 ) -> None:
     """Fetch metrics from a data connector."""
+    from rich.table import Table
+
+    from bizmetrics.connectors.demo import DemoConnector
     from bizmetrics.connectors.google_analytics import GoogleAnalyticsConnector
     from bizmetrics.connectors.meta_ads import MetaAdsConnector
+    from bizmetrics.db import Database
 
+    console = _get_console()
     settings = get_settings()
-    db = Database(settings.cache_dir / "bizmetrics.db")
 
     console.print(f"[bold]Fetching metrics from [cyan]{connector}[/cyan]...[/bold]")
 
@@ -75,60 +91,74 @@ def fetch(
         console.print("Available connectors: demo, google-analytics, meta-ads")
         raise typer.Exit(1)
 
-    data = conn.fetch(start_date=start_date, end_date=end_date)
+    # Stream records: only the terminal preview is kept unless caching
+    preview: list[dict[str, Any]] = []
+    records: list[dict[str, Any]] = []
+    count = 0
+    for count, row in enumerate(conn.fetch_iter(start_date=start_date, end_date=end_date), 1):
+        if cache:
+            records.append(row)
+        if count <= 10:
+            preview.append(row)
 
     if cache:
-        db.cache_metrics(connector, data)
+        with Database(settings.cache_dir / "bizmetrics.db") as db:
+            db.cache_metrics(connector, records)
         console.print("[dim]Results cached.[/dim]")
 
     # Display results in a table
     table = Table(title=f"📊 Metrics from {connector}")
-    if data:
+    if preview:
         # Show first 5 columns max for readability
-        columns = list(data[0].keys())[:7]
+        columns = list(preview[0].keys())[:7]
         for key in columns:
             table.add_column(key.replace("_", " ").title(), overflow="fold")
 
         # Show max 10 rows in terminal
-        for row in data[:10]:
+        for row in preview:
             table.add_row(*[str(row.get(c, ""))[:20] for c in columns])
 
-        if len(data) > 10:
+        if count > 10:
             table.add_row(*["..." for _ in columns])
 
     console.print(table)
-    console.print(f"\n[green]✓ Fetched {len(data)} records[/green]")
+    console.print(f"\n[green]✓ Fetched {count} records[/green]")
 
 
 @app.command()
 def export(
-    format: str = typer.Option("csv", "--format", "-f", help="Export format (csv, excel, json)"),
+    format: str = typer.Option(
+        "csv", "--format", "-f", help="Export format (csv, excel, parquet, auto)"
+    ),
     output: Path = typer.Option(Path("report"), "--output", "-o", help="Output file path"),
     connector: str = typer.Option("demo", "--connector", "-c", help="Connector to export data from"),
 ) -> None:
     """Export cached metrics to a file."""
-    settings = get_settings()
-    db = Database(settings.cache_dir / "bizmetrics.db")
+    from bizmetrics.db import Database
+    from bizmetrics.exporters.dispatch import FORMAT_SUFFIXES, export_data
 
-    data = db.get_cached_metrics(connector)
+    console = _get_console()
 
-    if not data:
-        console.print("[yellow]No cached data found. Run 'fetch' first.[/yellow]")
+    if format != "auto" and format not in FORMAT_SUFFIXES:
+        console.print(f"[red]Format '{format}' not supported.[/red]")
         raise typer.Exit(1)
 
-    output_file = output.with_suffix(f".{format}" if format != "excel" else ".xlsx")
+    settings = get_settings()
+    with Database(settings.cache_dir / "bizmetrics.db") as db:
+        data = db.get_cached_metrics(connector)
 
-    if format == "csv":
-        csv_exporter = CSVExporter()
-        csv_exporter.export(data, output_file)
-    elif format == "excel":
-        excel_exporter = ExcelExporter()
-        excel_exporter.export(data, output_file)
-    else:
-        console.print(f"[red]Format '{format}' not supported.[/red]")
+    if not data:
+        console.print("[yellow]No cached data found. Run 'fetch' first.[/yellow]")
         raise typer.Exit(1)
 
-    console.print(f"[green]✓ Exported to {output_file}[/green]")
+    try:
+        output_files = export_data(data, output, format)
+    except ImportError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1) from e
+
+    for output_file in output_files:
+        console.print(f"[green]✓ Exported to {output_file}[/green]")
 
 
 @app.command()
@@ -136,11 +166,17 @@ def cache(
     action: str = typer.Argument("stats", help="Cache action (stats, clear)"),
 ) -> None:
     """Manage the metrics cache."""
-    settings = get_settings()
-    db = Database(settings.cache_dir / "bizmetrics.db")
+    from rich.table import Table
+
+    from bizmetrics.db import Database
 
+    console = _get_console()
+    settings = get_settings()
     if action == "stats":
-        stats = db.get_cache_stats()
+        with Database(settings.cache_dir / "bizmetrics.db") as db:
+            # Expired entries are pruned here rather than on every fetch
+            db.prune_expired()
+            stats = db.get_cache_stats()
         table = Table(title="📁 Cache Statistics")
         table.add_column("Connector")
         table.add_column("Records")
@@ -151,7 +187,8 @@ def cache(
 
         console.print(table)
     elif action == "clear":
-        db.clear_cache()
+        with Database(settings.cache_dir / "bizmetrics.db") as db:
+            db.clear_cache()
         console.print("[green]✓ Cache cleared[/green]")
     else:
         console.print(f"[red]Unknown action: {action}[/red]")
@@ -162,6 +199,9 @@ def config(
     show: bool = typer.Option(False, "--show", "-s", help="Show current configuration"),
 ) -> None:
     """Manage configuration."""
+    from rich.table import Table
+
+    console = _get_console()
     settings = get_settings()
 
     if show:
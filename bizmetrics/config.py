@@ -1,53 +1,102 @@
-"""Configuration management using Pydantic Settings."""
+"""Configuration management from environment variables and a .env file."""
 
-from functools import lru_cache
+import os
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Literal
+from typing import Literal, cast
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+ENV_PREFIX = "BIZMETRICS_"
 
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+ExportFormat = Literal["csv", "excel", "parquet", "auto"]
 
-class Settings(BaseSettings):
-    """Application settings with environment variable support."""
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_EXPORT_FORMATS = ("csv", "excel", "parquet", "auto")
+
+# An inline comment on an unquoted value starts at whitespace followed by "#"
+_INLINE_COMMENT = re.compile(r"\s+#.*")
+
+
+def _read_env_file(path: Path) -> dict[str, str]:
+    """Parse simple KEY=VALUE lines from a .env file, if it exists."""
+    values: dict[str, str] = {}
+    if not path.is_file():
+        return values
 
-    model_config = SettingsConfigDict(
-        env_prefix="BIZMETRICS_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    for raw_line in path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.removeprefix("export ").partition("=")
+        value = value.strip()
+        if value[:1] in ("'", '"') and (end := value.find(value[0], 1)) != -1:
+            # Quoted values are taken verbatim; anything after the quote is ignored
+            value = value[1:end]
+        else:
+            value = _INLINE_COMMENT.sub("", value)
+        values[key.strip()] = value
+
+    return values
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Application settings with environment variable support."""
 
     # Directories
-    cache_dir: Path = Field(
-        default=Path.home() / ".bizmetrics" / "cache",
-        description="Directory for cache storage",
-    )
-    log_dir: Path = Field(
-        default=Path.home() / ".bizmetrics" / "logs",
-        description="Directory for log files",
-    )
+    cache_dir: Path = field(default_factory=lambda: Path.home() / ".bizmetrics" / "cache")
+    log_dir: Path = field(default_factory=lambda: Path.home() / ".bizmetrics" / "logs")
 
     # Logging
-    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
-        default="INFO",
-        description="Logging level",
-    )
+    log_level: LogLevel = "INFO"
 
     # Export defaults
-    default_format: Literal["csv", "excel", "json"] = Field(
-        default="csv",
-        description="Default export format",
-    )
+    default_format: ExportFormat = "csv"
+
+    def __post_init__(self) -> None:
+        if self.log_level not in _LOG_LEVELS:
+            raise ValueError(f"log_level must be one of {', '.join(_LOG_LEVELS)}")
+        if self.default_format not in _EXPORT_FORMATS:
+            raise ValueError(f"default_format must be one of {', '.join(_EXPORT_FORMATS)}")
+
+    @classmethod
+    def from_env(cls, env_file: Path = Path(".env")) -> "Settings":
+        """Build settings from BIZMETRICS_* variables.
+
+        Variables already set in the environment take precedence over
+        the ones read from ``env_file``. Names are case-insensitive.
+
+        Args:
+            env_file: Optional dotenv file with KEY=VALUE lines
+
+        Returns:
+            Settings instance
+        """
+        env = {**_read_env_file(env_file), **os.environ}
+        values = {
+            key[len(ENV_PREFIX) :].lower(): value
+            for key, value in env.items()
+            if key.upper().startswith(ENV_PREFIX)
+        }
+
+        defaults = cls()
+        return cls(
+            cache_dir=Path(values["cache_dir"]) if "cache_dir" in values else defaults.cache_dir,
+            log_dir=Path(values["log_dir"]) if "log_dir" in values else defaults.log_dir,
+            log_level=cast(LogLevel, values.get("log_level", defaults.log_level)),
+            default_format=cast(ExportFormat, values.get("default_format", defaults.default_format)),
+        )
+
 
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
-        # Ensure directories exist
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+_settings: Settings | None = None
 
 
-@lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    global _settings
+    if _settings is None:
+        # No directories are created here; Database creates the cache
+        # directory when it is opened.
+        _settings = Settings.from_env()
+    return _settings
@@ -1,8 +1,40 @@
-"""Data source connectors."""
+"""Data source connectors.
 
-from bizmetrics.connectors.base import BaseConnector
-from bizmetrics.connectors.demo import DemoConnector
-from bizmetrics.connectors.google_analytics import GoogleAnalyticsConnector
-from bizmetrics.connectors.meta_ads import MetaAdsConnector
+Connector classes are resolved on first attribute access (PEP 562) so that
+importing the package does not load every connector module.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from bizmetrics.connectors.base import BaseConnector
+    from bizmetrics.connectors.demo import DemoConnector
+    from bizmetrics.connectors.google_analytics import GoogleAnalyticsConnector
+    from bizmetrics.connectors.meta_ads import MetaAdsConnector
+
+_LAZY = {
+    "BaseConnector": "bizmetrics.connectors.base",
+    "DemoConnector": "bizmetrics.connectors.demo",
+    "GoogleAnalyticsConnector": "bizmetrics.connectors.google_analytics",
+    "MetaAdsConnector": "bizmetrics.connectors.meta_ads",
+}
 
 __all__ = ["BaseConnector", "DemoConnector", "GoogleAnalyticsConnector", "MetaAdsConnector"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a connector class the first time it is requested."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    obj = getattr(importlib.import_module(module_name), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """List lazily exported names alongside the module globals."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,24 @@
+"""Date range helpers shared by connectors."""
+
+from datetime import date, timedelta
+
+
+def parse_date_range(
+    start_date: str | None,
+    end_date: str | None,
+    default_days: int = 30,
+) -> tuple[date, date]:
+    """Parse a YYYY-MM-DD date range, defaulting to the last ``default_days``.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format, or None
+        end_date: End date in YYYY-MM-DD format, or None for today
+        default_days: Days before today used when start_date is None
+
+    Returns:
+        Tuple of (start, end) dates
+    """
+    today = date.today()
+    start = date.fromisoformat(start_date) if start_date else today - timedelta(days=default_days)
+    end = date.fromisoformat(end_date) if end_date else today
+    return start, end
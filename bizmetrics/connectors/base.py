@@ -1,6 +1,7 @@
 """Base connector interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any
 
 
@@ -29,6 +30,28 @@ class BaseConnector(ABC):
         """
         pass
 
+    def fetch_iter(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over metric records one at a time.
+
+        Connectors that can produce records incrementally override this so
+        callers do not need to hold the whole result in memory. The default
+        implementation iterates over ``fetch``.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            **kwargs: Additional connector-specific parameters
+
+        Yields:
+            Metric records as dictionaries
+        """
+        yield from self.fetch(start_date=start_date, end_date=end_date, **kwargs)
+
     @abstractmethod
     def validate_credentials(self) -> bool:
         """Validate connector credentials.
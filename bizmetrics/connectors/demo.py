@@ -1,11 +1,22 @@
 """Demo connector for testing and examples."""
 
-import random
-from datetime import datetime, timedelta
+from collections.abc import Iterator
 from typing import Any
 
+import numpy as np
+
+from bizmetrics.connectors._dates import parse_date_range
 from bizmetrics.connectors.base import BaseConnector
 
+_DEMO_METRICS = (
+    "sessions",
+    "page_views",
+    "bounce_rate",
+    "avg_session_duration",
+    "conversions",
+    "revenue",
+)
+
 
 class DemoConnector(BaseConnector):
     """Demo connector that generates sample business metrics."""
@@ -13,6 +24,14 @@ class DemoConnector(BaseConnector):
     name = "demo"
     description = "Demo connector with sample business metrics data"
 
+    def __init__(self, seed: int | None = None) -> None:
+        """Initialize demo connector.
+
+        Args:
+            seed: Random seed; the same seed reproduces the same data
+        """
+        self._rng = np.random.default_rng(seed)
+
     def fetch(
         self,
         start_date: str | None = None,
@@ -28,31 +47,61 @@ class DemoConnector(BaseConnector):
         Returns:
             List of sample metric records
         """
+        return list(self.fetch_iter(start_date=start_date, end_date=end_date, **kwargs))
+
+    def fetch_iter(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield sample metric records one day at a time.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+
+        Yields:
+            Sample metric records
+        """
         # Parse dates or use defaults
-        if start_date:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-        else:
-            start = datetime.now() - timedelta(days=30)
-
-        end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else datetime.now()
-
-        # Generate sample data
-        data: list[dict[str, Any]] = []
-        current = start
-
-        while current <= end:
-            data.append({
-                "date": current.strftime("%Y-%m-%d"),
-                "sessions": random.randint(1000, 5000),
-                "page_views": random.randint(3000, 15000),
-                "bounce_rate": round(random.uniform(30, 70), 2),
-                "avg_session_duration": round(random.uniform(60, 300), 2),
-                "conversions": random.randint(10, 100),
-                "revenue": round(random.uniform(500, 5000), 2),
-            })
-            current += timedelta(days=1)
-
-        return data
+        start, end = parse_date_range(start_date, end_date)
+
+        # Generate every column for the whole range at once; day arrays
+        # format straight to YYYY-MM-DD strings
+        days = np.arange(np.datetime64(start), np.datetime64(end) + 1, dtype="datetime64[D]")
+        n = len(days)
+
+        rng = self._rng
+        dates = days.astype(str).tolist()
+        sessions = rng.integers(1000, 5001, n).tolist()
+        page_views = rng.integers(3000, 15001, n).tolist()
+        bounce_rate = np.round(rng.uniform(30, 70, n), 2).tolist()
+        avg_session_duration = np.round(rng.uniform(60, 300, n), 2).tolist()
+        conversions = rng.integers(10, 101, n).tolist()
+        revenue = np.round(rng.uniform(500, 5000, n), 2).tolist()
+
+        return (
+            {
+                "date": d,
+                "sessions": s,
+                "page_views": pv,
+                "bounce_rate": br,
+                "avg_session_duration": asd,
+                "conversions": c,
+                "revenue": r,
+            }
+            for d, s, pv, br, asd, c, r in zip(
+                dates,
+                sessions,
+                page_views,
+                bounce_rate,
+                avg_session_duration,
+                conversions,
+                revenue,
+                strict=True,
+            )
+        )
 
     def validate_credentials(self) -> bool:
         """Demo connector always returns True for credentials."""
@@ -60,11 +109,4 @@ class DemoConnector(BaseConnector):
 
     def get_available_metrics(self) -> list[str]:
         """Get available demo metrics."""
-        return [
-            "sessions",
-            "page_views",
-            "bounce_rate",
-            "avg_session_duration",
-            "conversions",
-            "revenue",
-        ]
+        return list(_DEMO_METRICS)
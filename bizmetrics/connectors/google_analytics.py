@@ -1,10 +1,48 @@
 """Google Analytics 4 Data API connector."""
 
-from datetime import datetime, timedelta
+import random
+from collections.abc import Iterator
+from datetime import date, timedelta
 from typing import Any
 
+from bizmetrics.connectors._dates import parse_date_range
 from bizmetrics.connectors.base import BaseConnector
 
+_GA_DEFAULT_METRICS = (
+    "sessions",
+    "activeUsers",
+    "screenPageViews",
+    "bounceRate",
+    "averageSessionDuration",
+)
+
+_GA_METRICS = (
+    "sessions",
+    "activeUsers",
+    "newUsers",
+    "screenPageViews",
+    "bounceRate",
+    "averageSessionDuration",
+    "engagedSessions",
+    "engagementRate",
+    "eventsPerSession",
+    "conversions",
+    "totalRevenue",
+)
+
+_GA_DIMENSIONS = (
+    "date",
+    "country",
+    "city",
+    "deviceCategory",
+    "browser",
+    "operatingSystem",
+    "sessionSource",
+    "sessionMedium",
+    "sessionCampaignName",
+    "landingPage",
+)
+
 
 class GoogleAnalyticsConnector(BaseConnector):
     """Connector for Google Analytics 4 Data API.
@@ -60,42 +98,59 @@ class GoogleAnalyticsConnector(BaseConnector):
         Returns:
             List of metric records
         """
-        # Parse dates
-        if start_date:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-        else:
-            start = datetime.now() - timedelta(days=30)
+        return list(
+            self.fetch_iter(
+                start_date=start_date,
+                end_date=end_date,
+                metrics=metrics,
+                dimensions=dimensions,
+                **kwargs,
+            )
+        )
+
+    def fetch_iter(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        metrics: list[str] | None = None,
+        dimensions: list[str] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over Google Analytics records one day at a time.
+
+        Takes the same arguments as ``fetch``.
 
-        end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else datetime.now()
+        Yields:
+            Metric records
+        """
+        # Parse dates
+        start, end = parse_date_range(start_date, end_date)
 
         # Default metrics if not specified
         if not metrics:
-            metrics = ["sessions", "activeUsers", "screenPageViews", "bounceRate", "averageSessionDuration"]
+            metrics = list(_GA_DEFAULT_METRICS)
 
         # For demo purposes, generate realistic GA4-like data
         # In production, this would call the actual GA4 API
         if not self._is_configured():
-            return self._generate_demo_data(start, end, metrics)
+            return self._iter_demo_data(start, end, metrics)
 
         # Production implementation would use google-analytics-data library:
         # from google.analytics.data_v1beta import BetaAnalyticsDataClient
         # from google.analytics.data_v1beta.types import RunReportRequest
-        return self._generate_demo_data(start, end, metrics)
+        return self._iter_demo_data(start, end, metrics)
 
     def _is_configured(self) -> bool:
         """Check if connector is properly configured."""
         return bool(self.property_id and self.credentials_path)
 
-    def _generate_demo_data(
+    def _iter_demo_data(
         self,
-        start: datetime,
-        end: datetime,
+        start: date,
+        end: date,
         metrics: list[str],
-    ) -> list[dict[str, Any]]:
+    ) -> Iterator[dict[str, Any]]:
         """Generate realistic GA4-like demo data."""
-        import random
-
-        data: list[dict[str, Any]] = []
         current = start
 
         # Simulate realistic patterns
@@ -112,7 +167,7 @@ class GoogleAnalyticsConnector(BaseConnector):
             page_views = int(sessions * random.uniform(2.5, 4.5))
 
             record: dict[str, Any] = {
-                "date": current.strftime("%Y-%m-%d"),
+                "date": current.isoformat(),
                 "sessions": sessions,
                 "activeUsers": active_users,
                 "screenPageViews": page_views,
@@ -124,11 +179,9 @@ class GoogleAnalyticsConnector(BaseConnector):
                 "eventsPerSession": round(random.uniform(5, 15), 2),
             }
 
-            data.append(record)
+            yield record
             current += timedelta(days=1)
 
-        return data
-
     def validate_credentials(self) -> bool:
         """Validate Google Analytics credentials."""
         if not self._is_configured():
@@ -140,31 +193,8 @@ class GoogleAnalyticsConnector(BaseConnector):
 
     def get_available_metrics(self) -> list[str]:
         """Get available GA4 metrics."""
-        return [
-            "sessions",
-            "activeUsers",
-            "newUsers",
-            "screenPageViews",
-            "bounceRate",
-            "averageSessionDuration",
-            "engagedSessions",
-            "engagementRate",
-            "eventsPerSession",
-            "conversions",
-            "totalRevenue",
-        ]
+        return list(_GA_METRICS)
 
     def get_available_dimensions(self) -> list[str]:
         """Get available GA4 dimensions."""
-        return [
-            "date",
-            "country",
-            "city",
-            "deviceCategory",
-            "browser",
-            "operatingSystem",
-            "sessionSource",
-            "sessionMedium",
-            "sessionCampaignName",
-            "landingPage",
-        ]
+        return list(_GA_DIMENSIONS)
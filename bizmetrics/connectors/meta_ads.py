@@ -1,10 +1,59 @@
 """Meta (Facebook) Ads API connector."""
 
-from datetime import datetime, timedelta
+import random
+from collections.abc import Iterator
+from datetime import date, timedelta
 from typing import Any
 
+import numpy as np
+
+from bizmetrics.connectors._dates import parse_date_range
 from bizmetrics.connectors.base import BaseConnector
 
+# Shared generator for the vectorized demo data
+_rng = np.random.default_rng()
+
+_META_METRICS = (
+    "impressions",
+    "reach",
+    "clicks",
+    "ctr",
+    "cpc",
+    "cpm",
+    "spend",
+    "conversions",
+    "cost_per_conversion",
+    "frequency",
+    "video_views",
+    "video_p25_watched",
+    "video_p50_watched",
+    "video_p75_watched",
+    "video_p100_watched",
+)
+
+# Different performance by campaign type:
+# objective -> (impressions low/high, CPM low/high, CTR low/high)
+_OBJECTIVE_PARAMS: dict[str, tuple[int, int, float, float, float, float]] = {
+    "BRAND_AWARENESS": (50000, 150000, 3, 8, 0.5, 1.5),
+    "LEAD_GENERATION": (10000, 50000, 8, 15, 1.0, 3.0),
+    "CONVERSIONS": (5000, 30000, 12, 25, 1.5, 4.0),
+}
+_DEFAULT_OBJECTIVE_PARAMS = (20000, 80000, 5.0, 12.0, 1.0, 2.5)
+
+# Per-campaign metric columns, in record order after the campaign fields
+_METRIC_COLUMNS = (
+    "impressions",
+    "reach",
+    "clicks",
+    "ctr",
+    "cpc",
+    "cpm",
+    "spend",
+    "conversions",
+    "cost_per_conversion",
+    "frequency",
+)
+
 
 class MetaAdsConnector(BaseConnector):
     """Connector for Meta (Facebook/Instagram) Marketing API.
@@ -56,38 +105,47 @@ class MetaAdsConnector(BaseConnector):
         Returns:
             List of ad performance records
         """
-        # Parse dates
-        if start_date:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-        else:
-            start = datetime.now() - timedelta(days=30)
+        return list(
+            self.fetch_iter(start_date=start_date, end_date=end_date, level=level, **kwargs)
+        )
+
+    def fetch_iter(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        level: str = "campaign",
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over ad performance records, day by day.
 
-        end = datetime.strptime(end_date, "%Y-%m-%d") if end_date else datetime.now()
+        Takes the same arguments as ``fetch``.
+
+        Yields:
+            Ad performance records
+        """
+        # Parse dates
+        start, end = parse_date_range(start_date, end_date)
 
         # For demo purposes, generate realistic Meta Ads-like data
         if not self._is_configured():
-            return self._generate_demo_data(start, end, level)
+            return self._iter_demo_data(start, end, level)
 
         # Production implementation would use facebook-business SDK:
         # from facebook_business.api import FacebookAdsApi
         # from facebook_business.adobjects.adaccount import AdAccount
-        return self._generate_demo_data(start, end, level)
+        return self._iter_demo_data(start, end, level)
 
     def _is_configured(self) -> bool:
         """Check if connector is properly configured."""
         return bool(self.access_token and self.ad_account_id)
 
-    def _generate_demo_data(
+    def _iter_demo_data(
         self,
-        start: datetime,
-        end: datetime,
+        start: date,
+        end: date,
         level: str,
-    ) -> list[dict[str, Any]]:
+    ) -> Iterator[dict[str, Any]]:
         """Generate realistic Meta Ads-like demo data."""
-        import random
-
-        data: list[dict[str, Any]] = []
-
         # Simulate different campaigns
         campaigns = [
             {"id": "camp_001", "name": "Brand Awareness Q4", "objective": "BRAND_AWARENESS"},
@@ -96,57 +154,58 @@ class MetaAdsConnector(BaseConnector):
             {"id": "camp_004", "name": "Conversions - Purchase", "objective": "CONVERSIONS"},
         ]
 
-        current = start
-        while current <= end:
-            for camp in campaigns:
-                # Different performance by campaign type
-                if camp["objective"] == "BRAND_AWARENESS":
-                    impressions = random.randint(50000, 150000)
-                    cpm = random.uniform(3, 8)
-                    ctr = random.uniform(0.5, 1.5)
-                elif camp["objective"] == "LEAD_GENERATION":
-                    impressions = random.randint(10000, 50000)
-                    cpm = random.uniform(8, 15)
-                    ctr = random.uniform(1.0, 3.0)
-                elif camp["objective"] == "CONVERSIONS":
-                    impressions = random.randint(5000, 30000)
-                    cpm = random.uniform(12, 25)
-                    ctr = random.uniform(1.5, 4.0)
-                else:
-                    impressions = random.randint(20000, 80000)
-                    cpm = random.uniform(5, 12)
-                    ctr = random.uniform(1.0, 2.5)
-
-                clicks = int(impressions * (ctr / 100))
-                spend = round((impressions / 1000) * cpm, 2)
-
-                # Calculate derived metrics
-                cpc = round(spend / max(clicks, 1), 2)
-                conversions = int(clicks * random.uniform(0.01, 0.08))
-                cost_per_conversion = round(spend / max(conversions, 1), 2)
-
-                record: dict[str, Any] = {
-                    "date": current.strftime("%Y-%m-%d"),
-                    "campaign_id": camp["id"],
-                    "campaign_name": camp["name"],
-                    "objective": camp["objective"],
-                    "impressions": impressions,
-                    "reach": int(impressions * random.uniform(0.6, 0.9)),
-                    "clicks": clicks,
-                    "ctr": round(ctr, 2),
-                    "cpc": cpc,
-                    "cpm": round(cpm, 2),
-                    "spend": spend,
-                    "conversions": conversions,
-                    "cost_per_conversion": cost_per_conversion,
-                    "frequency": round(random.uniform(1.1, 2.5), 2),
-                }
-
-                data.append(record)
-
-            current += timedelta(days=1)
-
-        return data
+        n = max((end - start).days + 1, 0)
+        dates = [(start + timedelta(days=i)).isoformat() for i in range(n)]
+
+        # Draw each campaign's metrics for the whole date range at once
+        campaign_rows: list[list[tuple[Any, ...]]] = []
+        for camp in campaigns:
+            imp_lo, imp_hi, cpm_lo, cpm_hi, ctr_lo, ctr_hi = _OBJECTIVE_PARAMS.get(
+                camp["objective"], _DEFAULT_OBJECTIVE_PARAMS
+            )
+            impressions = _rng.integers(imp_lo, imp_hi + 1, n)
+            cpm = _rng.uniform(cpm_lo, cpm_hi, n)
+            ctr = _rng.uniform(ctr_lo, ctr_hi, n)
+
+            clicks = (impressions * (ctr / 100)).astype(np.int64)
+            spend = np.round((impressions / 1000) * cpm, 2)
+
+            # Calculate derived metrics
+            cpc = np.round(spend / np.maximum(clicks, 1), 2)
+            conversions = (clicks * _rng.uniform(0.01, 0.08, n)).astype(np.int64)
+            cost_per_conversion = np.round(spend / np.maximum(conversions, 1), 2)
+            reach = (impressions * _rng.uniform(0.6, 0.9, n)).astype(np.int64)
+            frequency = np.round(_rng.uniform(1.1, 2.5, n), 2)
+
+            campaign_rows.append(
+                list(
+                    zip(
+                        impressions.tolist(),
+                        reach.tolist(),
+                        clicks.tolist(),
+                        np.round(ctr, 2).tolist(),
+                        cpc.tolist(),
+                        np.round(cpm, 2).tolist(),
+                        spend.tolist(),
+                        conversions.tolist(),
+                        cost_per_conversion.tolist(),
+                        frequency.tolist(),
+                        strict=True,
+                    )
+                )
+            )
+
+        return (
+            {
+                "date": day,
+                "campaign_id": camp["id"],
+                "campaign_name": camp["name"],
+                "objective": camp["objective"],
+                **dict(zip(_METRIC_COLUMNS, rows[i], strict=True)),
+            }
+            for i, day in enumerate(dates)
+            for camp, rows in zip(campaigns, campaign_rows, strict=True)
+        )
 
     def validate_credentials(self) -> bool:
         """Validate Meta API credentials."""
@@ -154,29 +213,11 @@ class MetaAdsConnector(BaseConnector):
 
     def get_available_metrics(self) -> list[str]:
         """Get available Meta Ads metrics."""
-        return [
-            "impressions",
-            "reach",
-            "clicks",
-            "ctr",
-            "cpc",
-            "cpm",
-            "spend",
-            "conversions",
-            "cost_per_conversion",
-            "frequency",
-            "video_views",
-            "video_p25_watched",
-            "video_p50_watched",
-            "video_p75_watched",
-            "video_p100_watched",
-        ]
+        return list(_META_METRICS)
 
     def get_campaign_insights(self, campaign_id: str) -> dict[str, Any]:
         """Get detailed insights for a specific campaign."""
         # Demo implementation
-        import random
-
         return {
             "campaign_id": campaign_id,
             "lifetime_spend": round(random.uniform(5000, 50000), 2),
@@ -2,10 +2,53 @@
 
 import json
 import sqlite3
+import time
+import zlib
 from datetime import datetime
 from pathlib import Path
+from types import TracebackType
 from typing import Any, cast
 
+try:
+    import orjson
+
+    def _dumps(data: list[dict[str, Any]]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def _loads(payload: bytes) -> Any:
+        return orjson.loads(payload)
+
+except ImportError:  # pragma: no cover - orjson ships wheels for supported platforms
+
+    def _dumps(data: list[dict[str, Any]]) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    def _loads(payload: bytes) -> Any:
+        return json.loads(payload)
+
+# Bump when the metrics_cache layout changes. Cached payloads are disposable,
+# so older tables are dropped and rebuilt rather than migrated row by row.
+SCHEMA_VERSION = 3
+
+# Payloads larger than this are zlib-compressed before being stored
+COMPRESS_THRESHOLD = 8 * 1024
+
+
+def _encode(data: list[dict[str, Any]]) -> bytes:
+    """Serialize records to a (possibly compressed) BLOB."""
+    payload = _dumps(data)
+    if len(payload) > COMPRESS_THRESHOLD:
+        return zlib.compress(payload)
+    return payload
+
+
+def _decode(blob: bytes) -> list[dict[str, Any]]:
+    """Deserialize a BLOB written by ``_encode``."""
+    # A JSON array always starts with "[", a zlib stream never does
+    if not blob.startswith(b"["):
+        blob = zlib.decompress(blob)
+    return cast(list[dict[str, Any]], _loads(blob))
+
 
 class Database:
     """SQLite database handler for metrics caching."""
@@ -14,31 +57,56 @@ class Database:
         """Initialize database connection."""
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = self._connect()
         self._init_schema()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
+    def __enter__(self) -> "Database":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection shared by all queries on this instance."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
         return conn
 
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
     def _init_schema(self) -> None:
         """Initialize database schema."""
-        with self._get_connection() as conn:
+        with self._conn as conn:
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version < SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS metrics_cache")
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS metrics_cache (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    connector TEXT NOT NULL,
-                    data TEXT NOT NULL,
+                    connector TEXT NOT NULL UNIQUE,
+                    data BLOB NOT NULL,
+                    record_count INTEGER NOT NULL DEFAULT 0,
                     created_at TEXT NOT NULL,
-                    expires_at TEXT
+                    expires_at INTEGER NOT NULL
                 )
             """)
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_connector
-                ON metrics_cache(connector)
+                CREATE INDEX IF NOT EXISTS idx_expires
+                ON metrics_cache(expires_at)
             """)
-            conn.commit()
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
     def cache_metrics(
         self,
@@ -47,64 +115,69 @@ class Database:
         ttl_hours: int = 24,
     ) -> None:
         """Cache metrics data."""
-        now = datetime.now()
-        expires = datetime.fromtimestamp(now.timestamp() + ttl_hours * 3600)
+        # created_at is kept human-readable for stats; expiry is Unix seconds
+        created_at = datetime.now().isoformat()
+        expires_at = int(time.time()) + ttl_hours * 3600
 
-        with self._get_connection() as conn:
-            # Clear old cache for this connector
-            conn.execute(
-                "DELETE FROM metrics_cache WHERE connector = ?",
-                (connector,),
-            )
-            # Insert new data
+        with self._conn as conn:
+            # Replace any previous cache for this connector in one statement
             conn.execute(
                 """
-                INSERT INTO metrics_cache (connector, data, created_at, expires_at)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO metrics_cache
+                    (connector, data, record_count, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(connector) DO UPDATE SET
+                    data = excluded.data,
+                    record_count = excluded.record_count,
+                    created_at = excluded.created_at,
+                    expires_at = excluded.expires_at
                 """,
-                (connector, json.dumps(data), now.isoformat(), expires.isoformat()),
+                (connector, _encode(data), len(data), created_at, expires_at),
             )
-            conn.commit()
 
     def get_cached_metrics(self, connector: str) -> list[dict[str, Any]]:
         """Get cached metrics for a connector."""
-        with self._get_connection() as conn:
-            row = conn.execute(
-                """
-                SELECT data, expires_at FROM metrics_cache
-                WHERE connector = ?
-                ORDER BY created_at DESC
-                LIMIT 1
-                """,
-                (connector,),
-            ).fetchone()
+        row = self._conn.execute(
+            """
+            SELECT data, expires_at FROM metrics_cache
+            WHERE connector = ?
+            """,
+            (connector,),
+        ).fetchone()
 
-            if not row:
-                return []
+        if not row:
+            return []
 
-            # Check expiration
-            expires = datetime.fromisoformat(row["expires_at"])
-            if datetime.now() > expires:
-                return []
+        # Check expiration
+        if time.time() > row["expires_at"]:
+            return []
 
-            return cast(list[dict[str, Any]], json.loads(row["data"]))
+        return _decode(row["data"])
 
     def get_cache_stats(self) -> list[tuple[str, int, str]]:
         """Get cache statistics."""
-        with self._get_connection() as conn:
-            rows = conn.execute("""
-                SELECT
-                    connector,
-                    json_array_length(data) as record_count,
-                    created_at
-                FROM metrics_cache
-                ORDER BY created_at DESC
-            """).fetchall()
-
-            return [(row["connector"], row["record_count"], row["created_at"]) for row in rows]
+        rows = self._conn.execute("""
+            SELECT connector, record_count, created_at
+            FROM metrics_cache
+            ORDER BY created_at DESC
+        """).fetchall()
+
+        return [(row["connector"], row["record_count"], row["created_at"]) for row in rows]
+
+    def prune_expired(self) -> int:
+        """Delete expired cache entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._conn as conn:
+            cursor = conn.execute(
+                "DELETE FROM metrics_cache WHERE expires_at < ?",
+                (int(time.time()),),
+            )
+        return cursor.rowcount
 
     def clear_cache(self) -> None:
         """Clear all cached data."""
-        with self._get_connection() as conn:
+        with self._conn as conn:
             conn.execute("DELETE FROM metrics_cache")
-            conn.commit()
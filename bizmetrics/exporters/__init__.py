@@ -1,6 +1,40 @@
-"""Data exporters."""
+"""Data exporters.
 
-from bizmetrics.exporters.csv_exporter import CSVExporter
-from bizmetrics.exporters.excel_exporter import ExcelExporter
+Exporters are resolved on first attribute access (PEP 562) so that
+importing the package does not load openpyxl or pyarrow.
+"""
 
-__all__ = ["CSVExporter", "ExcelExporter"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from bizmetrics.exporters.csv_exporter import CSVExporter
+    from bizmetrics.exporters.dispatch import export_data
+    from bizmetrics.exporters.excel_exporter import ExcelExporter
+    from bizmetrics.exporters.parquet_exporter import ParquetExporter
+
+_LAZY = {
+    "CSVExporter": "bizmetrics.exporters.csv_exporter",
+    "ExcelExporter": "bizmetrics.exporters.excel_exporter",
+    "ParquetExporter": "bizmetrics.exporters.parquet_exporter",
+    "export_data": "bizmetrics.exporters.dispatch",
+}
+
+__all__ = ["CSVExporter", "ExcelExporter", "ParquetExporter", "export_data"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exporter the first time it is requested."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    obj = getattr(importlib.import_module(module_name), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    """List lazily exported names alongside the module globals."""
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,86 @@
+"""Output helpers shared by the exporters."""
+
+import io
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer
+
+# Writes waiting for the I/O thread; bounds memory if the disk is slower
+# than the producer.
+_MAX_PENDING_WRITES = 64
+
+
+class ThreadedFileSink(io.RawIOBase):
+    """Write-only file whose write syscalls run on a background thread.
+
+    ``write()`` only copies the bytes onto a queue, so a CPU-bound producer
+    (such as zlib deflate inside ``zipfile``) keeps going while the previous
+    block is written to disk. The sink is not seekable; ``zipfile`` handles
+    that by writing data descriptors after each member.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open ``path`` for writing and start the I/O thread."""
+        super().__init__()
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        self._position = 0
+        self._error: OSError | None = None
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=_MAX_PENDING_WRITES)
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        """Write queued blocks until the close sentinel arrives."""
+        while (block := self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+            try:
+                view = memoryview(block)
+                while view:
+                    view = view[os.write(self._fd, view) :]
+            except OSError as e:
+                self._error = e
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, b: "ReadableBuffer") -> int:
+        if self._error is not None:
+            raise self._error
+        block = bytes(b)
+        self._queue.put(block)
+        self._position += len(block)
+        return len(block)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._queue.put(None)
+            self._thread.join()
+            os.close(self._fd)
+        super().close()
+        if self._error is not None:
+            raise self._error
+
+
+def open_threaded(path: str | Path, buffer_size: int = 1024 * 1024) -> io.BufferedWriter:
+    """Open ``path`` as a buffered writer backed by a ``ThreadedFileSink``."""
+    return io.BufferedWriter(ThreadedFileSink(path), buffer_size=buffer_size)
+
+
+def write_bytes(path: str | Path, data: "ReadableBuffer") -> None:
+    """Write an in-memory file to ``path`` with a single write in the common case."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
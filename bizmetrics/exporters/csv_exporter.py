@@ -1,6 +1,9 @@
 """CSV exporter."""
 
 import csv
+from collections.abc import Callable
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -20,7 +23,22 @@ class CSVExporter:
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Plain csv.writer with a fixed key order avoids DictWriter's per-row
+        # field validation and lookups. The header is the union of all keys.
+        keys = tuple(dict.fromkeys(chain.from_iterable(data)))
+        getter: Callable[[dict[str, Any]], Any] = itemgetter(*keys)
+        if len(keys) == 1:
+            # itemgetter with a single key returns the bare value, not a tuple
+            key = keys[0]
+            getter = lambda row: (row[key],)  # noqa: E731
+
+        def project(row: dict[str, Any]) -> Any:
+            try:
+                return getter(row)
+            except KeyError:
+                return tuple(row.get(k, "") for k in keys)
+
         with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(f)
+            writer.writerow(keys)
+            writer.writerows(map(project, data))
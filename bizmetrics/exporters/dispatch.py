@@ -0,0 +1,66 @@
+"""Pick an exporter for a format and write the records."""
+
+import importlib.util
+from pathlib import Path
+from typing import Any
+
+# With format="auto", exports of at least this many rows go to Parquet
+# (when pyarrow is installed); smaller ones stay Excel-friendly.
+AUTO_PARQUET_MIN_ROWS = 10_000
+
+FORMAT_SUFFIXES = {
+    "csv": ".csv",
+    "excel": ".xlsx",
+    "parquet": ".parquet",
+}
+
+
+def resolve_format(format: str, row_count: int) -> str:
+    """Resolve ``"auto"`` to a concrete format for ``row_count`` rows.
+
+    Args:
+        format: Requested format (csv, excel, parquet or auto)
+        row_count: Number of records to export
+
+    Returns:
+        Concrete export format
+    """
+    if format != "auto":
+        return format
+    if row_count >= AUTO_PARQUET_MIN_ROWS and importlib.util.find_spec("pyarrow") is not None:
+        return "parquet"
+    return "excel"
+
+
+def export_data(data: list[dict[str, Any]], output: Path, format: str = "auto") -> list[Path]:
+    """Export records with the exporter matching ``format``.
+
+    Args:
+        data: List of metric records
+        output: Output path; its suffix is replaced to match the format
+        format: Export format (csv, excel, parquet or auto)
+
+    Returns:
+        Paths of the written files. Excel exports beyond the sheet row limit
+        are split into numbered part files.
+    """
+    format = resolve_format(format, len(data))
+    if format not in FORMAT_SUFFIXES:
+        raise ValueError(f"Unsupported export format: {format}")
+
+    output_file = output.with_suffix(FORMAT_SUFFIXES[format])
+
+    if format == "csv":
+        from bizmetrics.exporters.csv_exporter import CSVExporter
+
+        CSVExporter().export(data, output_file)
+    elif format == "excel":
+        from bizmetrics.exporters.excel_exporter import ExcelExporter
+
+        return ExcelExporter().export(data, output_file)
+    else:
+        from bizmetrics.exporters.parquet_exporter import ParquetExporter
+
+        ParquetExporter().export(data, output_file)
+
+    return [output_file]
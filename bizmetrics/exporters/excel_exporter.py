@@ -1,36 +1,432 @@
 """Excel exporter."""
 
+import importlib.util
+import io
+import warnings
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime, time, timedelta
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
-import pandas as pd
+from openpyxl import Workbook
+from openpyxl.compat.numbers import NUMERIC_TYPES
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.dimensions import ColumnDimension
+
+from bizmetrics.exporters._output import open_threaded, write_bytes
+
+ExcelEngine = Literal["auto", "openpyxl", "xlsxwriter", "rust"]
+
+# Excel's row limit per sheet, minus the header row
+MAX_EXCEL_ROWS = 1_048_575
+
+# Column auto-fit is cosmetic: widths are estimated from the first rows only
+# and capped so a single long value cannot produce a huge column.
+WIDTH_SAMPLE_ROWS = 1000
+MAX_COLUMN_WIDTH = 50
+
+# Values every Excel writer handles natively; anything else goes through _to_text()
+_CELL_TYPES = (*NUMERIC_TYPES, str, bool, datetime, date, time, timedelta, type(None))
+
+# Exact-type lookup for the common case, so most values skip the isinstance scan
+_NATIVE_TYPES = frozenset(_CELL_TYPES)
+
+# Day zero of Excel's 1900 date system. Serials from it are correct from
+# 1900-03-01 on, after Excel's phantom 1900-02-29.
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+_EXCEL_MIN_SERIAL_DATE = date(1900, 3, 1)
+
+# Number formats for date and datetime cells; datetimes keep the time of day
+DATE_FORMAT = "yyyy-mm-dd"
+DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+
+
+def _to_text(value: Any) -> str:
+    """Text for a value the Excel writers do not accept as is."""
+    # Decode bytes like openpyxl does rather than writing their repr
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+def _row_values(record: dict[str, Any], columns: list[str]) -> list[Any]:
+    """Project a record onto ``columns`` as values the Excel writers accept."""
+    return [
+        value if type(value) in _NATIVE_TYPES or isinstance(value, _CELL_TYPES) else _to_text(value)
+        for value in map(record.get, columns)
+    ]
+
+
+def _make_projector(columns: list[str]) -> Callable[[dict[str, Any]], list[Any]]:
+    """Build a ``_row_values`` equivalent specialized for ``columns``.
+
+    ``itemgetter`` fetches every column in one C call. Records missing a
+    column raise KeyError there and take the ``dict.get`` path instead.
+    """
+    getter: Callable[[dict[str, Any]], tuple[Any, ...]] = itemgetter(*columns)
+    if len(columns) == 1:
+        # itemgetter with a single key returns the bare value, not a tuple
+        key = columns[0]
+        getter = lambda record: (record[key],)  # noqa: E731
+
+    def project(record: dict[str, Any]) -> list[Any]:
+        try:
+            values = getter(record)
+        except KeyError:
+            return _row_values(record, columns)
+        return [
+            value
+            if type(value) in _NATIVE_TYPES or isinstance(value, _CELL_TYPES)
+            else _to_text(value)
+            for value in values
+        ]
+
+    return project
+
+
+def _export_one(job: tuple[ExcelEngine, list[dict[str, Any]], Path]) -> None:
+    """Process-pool entry point for ``ExcelExporter.export_many``."""
+    engine, data, output_path = job
+    # The parent directory was created once by export_many()
+    ExcelExporter(engine=engine)._export_parts(data, output_path)
+
+
+def _part_path(output_path: Path, part: int) -> Path:
+    """Path of the numbered part file ``part`` of a split export."""
+    return output_path.with_stem(f"{output_path.stem}_part{part:03d}")
+
+
+def _date_columns(sample: list[dict[str, Any]], columns: list[str]) -> dict[int, str]:
+    """Number formats by index for columns whose first non-null sampled value is a date.
+
+    Naive datetimes get ``DATETIME_FORMAT`` and plain dates ``DATE_FORMAT``.
+    """
+    found = {}
+    for idx, col in enumerate(columns):
+        value = next((v for record in sample if (v := record.get(col)) is not None), None)
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                found[idx] = DATETIME_FORMAT
+        elif isinstance(value, date):
+            found[idx] = DATE_FORMAT
+    return found
+
+
+def _excel_serial(value: Any) -> Any:
+    """Convert a date or naive datetime to an Excel serial number.
+
+    Anything else, including dates Excel's 1900 system cannot represent
+    exactly, is returned unchanged for the writer to handle.
+    """
+    value_type = type(value)
+    if value_type is date and value >= _EXCEL_MIN_SERIAL_DATE:
+        return value.toordinal() - _EXCEL_EPOCH.toordinal()
+    if value_type is datetime and value.tzinfo is None and value.date() >= _EXCEL_MIN_SERIAL_DATE:
+        return (value - _EXCEL_EPOCH) / timedelta(days=1)
+    return value
 
 
 class ExcelExporter:
     """Export metrics to Excel format."""
 
-    def export(self, data: list[dict[str, Any]], output_path: Path) -> None:
+    def __init__(self, engine: ExcelEngine = "auto") -> None:
+        """Initialize the exporter.
+
+        Args:
+            engine: Writer backend. ``"auto"`` picks xlsxwriter when it is
+                installed, since it is faster for pure writes, and falls back
+                to openpyxl otherwise. ``"rust"`` uses the Rust-backed
+                rustpy-xlsxwriter and is only used when asked for, because it
+                stores every number as a float; without that package it
+                warns and falls back to openpyxl.
+        """
+        if engine not in ("auto", "openpyxl", "xlsxwriter", "rust"):
+            raise ValueError(f"Unknown Excel engine: {engine}")
+
+        has_xlsxwriter = importlib.util.find_spec("xlsxwriter") is not None
+        if engine == "auto":
+            engine = "xlsxwriter" if has_xlsxwriter else "openpyxl"
+        elif engine == "xlsxwriter" and not has_xlsxwriter:
+            raise ImportError(
+                "The xlsxwriter engine requires the 'xlsxwriter' package "
+                "(pip install 'bizmetrics-cli[excel]')"
+            )
+        elif engine == "rust" and importlib.util.find_spec("rustpy_xlsxwriter") is None:
+            warnings.warn(
+                "The rust engine requires the 'rustpy-xlsxwriter' package "
+                "(pip install 'bizmetrics-cli[excel-rust]'); using openpyxl instead",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            engine = "openpyxl"
+        self.engine: ExcelEngine = engine
+
+    def export(
+        self,
+        data: Iterable[dict[str, Any]],
+        output_path: Path,
+        chunk_size: int | None = None,
+    ) -> list[Path]:
         """Export data to Excel file.
 
+        Rows are streamed into a write-only workbook, so memory stays flat
+        instead of holding every cell as an object. Iterables other than
+        lists are consumed once and, with the openpyxl and xlsxwriter
+        engines, never held in memory in full. The rust engine takes a
+        whole sheet per call, so it buffers each part file's rows.
+
         Args:
-            data: List of metric records
+            data: Metric records. For a list, the columns are the keys of
+                every record; for other iterables, the keys of the first
+                ``WIDTH_SAMPLE_ROWS`` records of each file.
             output_path: Output file path
+            chunk_size: Maximum rows per file. Larger exports are split into
+                ``<stem>_part001.xlsx``, ``<stem>_part002.xlsx``, ... Exports
+                beyond Excel's row limit are always split.
+
+        Returns:
+            Paths of the written files, in part order; empty if there was
+            no data
         """
-        if not data:
-            return
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        if isinstance(data, list):
+            if not data:
+                return []
+        else:
+            rows = iter(data)
+            first = next(rows, None)
+            if first is None:
+                return []
+            data = chain((first,), rows)
+
+        self.ensure_parent(output_path)
+        return self._export_parts(data, output_path, chunk_size)
 
+    @staticmethod
+    def ensure_parent(output_path: Path) -> None:
+        """Create the directory ``output_path`` will be written to."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        df = pd.DataFrame(data)
+    def _export_parts(
+        self,
+        data: Iterable[dict[str, Any]],
+        output_path: Path,
+        chunk_size: int | None = None,
+    ) -> list[Path]:
+        """Write ``data`` as one or more part files into an existing directory.
+
+        Returns:
+            Paths of the written files, in part order
+        """
+        # Lists can be scanned for every key up front; other iterables are
+        # read once, so their columns come from each file's first rows.
+        columns = list(dict.fromkeys(chain.from_iterable(data))) if isinstance(data, list) else None
+        limit = min(chunk_size or MAX_EXCEL_ROWS, MAX_EXCEL_ROWS)
+
+        rows = iter(data)
+        record = next(rows, None)
+        written: list[Path] = []
+        while record is not None:
+            part = len(written) + 1
+            part_path = output_path if part == 1 else _part_path(output_path, part)
+            self._export_single(chain((record,), islice(rows, limit - 1)), part_path, columns)
+            written.append(part_path)
+
+            record = next(rows, None)
+            if part == 1 and record is not None:
+                # More rows follow, so the first file is numbered like the rest
+                written[0] = output_path.replace(_part_path(output_path, 1))
+        return written
+
+    def export_many(
+        self,
+        jobs: list[tuple[list[dict[str, Any]], Path]],
+        max_workers: int | None = None,
+    ) -> None:
+        """Export several files in parallel.
+
+        Workbook serialization is CPU-bound Python code that holds the GIL,
+        so jobs run in separate processes rather than threads.
+
+        Args:
+            jobs: ``(data, output_path)`` pairs, one per file
+            max_workers: Maximum worker processes (defaults to the CPU count)
+        """
+        jobs = [(data, output_path) for data, output_path in jobs if data]
+
+        # One mkdir per distinct directory rather than per file
+        for output_path in {output_path.parent: output_path for _, output_path in jobs}.values():
+            self.ensure_parent(output_path)
+
+        if len(jobs) <= 1 or max_workers == 1:
+            for data, output_path in jobs:
+                self._export_parts(data, output_path)
+            return
+
+        # Imported here so single-file exports do not load multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(len(jobs), max_workers) if max_workers else None
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # list() re-raises the first worker exception here
+            list(executor.map(_export_one, [(self.engine, data, path) for data, path in jobs]))
 
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="Metrics", index=False)
+    def _export_single(
+        self,
+        rows: Iterator[dict[str, Any]],
+        output_path: Path,
+        columns: list[str] | None = None,
+    ) -> None:
+        """Write one workbook with a single Metrics sheet."""
+        # Only this sample is buffered; the remaining rows stream through
+        head = list(islice(rows, WIDTH_SAMPLE_ROWS))
+        if columns is None:
+            # Union of keys across the sample, in first-seen order
+            columns = list(dict.fromkeys(chain.from_iterable(head)))
+
+        # Auto-adjust column widths. The writers stream rows, so widths are
+        # measured up front on the sample before the first row is written.
+        widths = [len(col) for col in columns]
+        for record in head:
+            for idx, col in enumerate(columns):
+                value = record.get(col)
+                if value is None:
+                    continue
+                length = len(value) if type(value) is str else len(str(value))
+                if length > widths[idx]:
+                    widths[idx] = length
+        widths = [min(width + 2, MAX_COLUMN_WIDTH) for width in widths]
+
+        # A part that fit entirely in the sample is small enough to build in
+        # memory and write with one syscall instead of many small writes
+        in_memory = len(head) < WIDTH_SAMPLE_ROWS
+
+        data = chain(head, rows)
+        output_file = str(output_path)
+        if self.engine == "xlsxwriter":
+            date_columns = _date_columns(head, columns)
+            self._write_xlsxwriter(data, columns, widths, date_columns, output_file, in_memory)
+        elif self.engine == "rust":
+            self._write_rust(data, columns, widths, output_file)
+        else:
+            self._write_openpyxl(data, columns, widths, output_file, in_memory)
+
+    def _write_openpyxl(
+        self,
+        data: Iterable[dict[str, Any]],
+        columns: list[str],
+        widths: list[int],
+        output_file: str,
+        in_memory: bool = False,
+    ) -> None:
+        """Stream rows into an openpyxl write-only workbook."""
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Metrics")
+        # Write-only sheets emit column settings before the first row. Each
+        # dimension is built complete instead of being created on first
+        # lookup and then mutated.
+        column_dimensions = worksheet.column_dimensions
+        for idx, width in enumerate(widths, start=1):
+            letter = get_column_letter(idx)
+            column_dimensions[letter] = ColumnDimension(
+                worksheet, index=letter, width=width, min=idx, max=idx
+            )
+
+        project = _make_projector(columns)
+        worksheet.append(columns)
+        for record in data:
+            worksheet.append(project(record))
+
+        if in_memory:
+            buffer = io.BytesIO()
+            workbook.save(buffer)
+            write_bytes(output_file, buffer.getbuffer())
+            return
+
+        # Deflate runs on this thread while the previous block is written
+        with open_threaded(output_file) as stream:
+            workbook.save(stream)
+
+    def _write_xlsxwriter(
+        self,
+        data: Iterable[dict[str, Any]],
+        columns: list[str],
+        widths: list[int],
+        date_columns: dict[int, str],
+        output_file: str,
+        in_memory: bool = False,
+    ) -> None:
+        """Stream rows with xlsxwriter in constant-memory mode."""
+        import xlsxwriter
+
+        buffer = io.BytesIO() if in_memory else None
+        workbook = xlsxwriter.Workbook(
+            buffer if buffer is not None else output_file,
+            {
+                # Flush each row to disk as soon as the next one starts
+                "constant_memory": not in_memory,
+                "in_memory": in_memory,
+                # Dates outside the date columns are written with the
+                # lossless format
+                "default_date_format": DATETIME_FORMAT,
+                # Write NaN/inf as #NUM!/#DIV/0! instead of raising
+                "nan_inf_to_errors": True,
+                # Metric values are data, never links or formulas
+                "strings_to_urls": False,
+                "strings_to_formulas": False,
+            },
+        )
+        worksheet = workbook.add_worksheet("Metrics")
+
+        # Date columns are written as plain serial numbers and get their date
+        # format from the column, which skips xlsxwriter's per-cell datetime
+        # dispatch.
+        formats = {
+            num_format: workbook.add_format({"num_format": num_format})
+            for num_format in set(date_columns.values())
+        }
+        for idx, width in enumerate(widths):
+            num_format = date_columns.get(idx)
+            worksheet.set_column(idx, idx, width, formats[num_format] if num_format else None)
+
+        project = _make_projector(columns)
+        worksheet.write_row(0, 0, columns)
+        for row_idx, record in enumerate(data, start=1):
+            values = project(record)
+            for idx in date_columns:
+                values[idx] = _excel_serial(values[idx])
+            worksheet.write_row(row_idx, 0, values)
+
+        workbook.close()
+        if buffer is not None:
+            write_bytes(output_file, buffer.getbuffer())
+
+    def _write_rust(
+        self,
+        data: Iterable[dict[str, Any]],
+        columns: list[str],
+        widths: list[int],
+        output_file: str,
+    ) -> None:
+        """Write the whole sheet in one call to the Rust writer.
+
+        rustpy-xlsxwriter has no row-by-row API, so the part's rows are
+        materialized here.
+        """
+        import rustpy_xlsxwriter
 
-            # Auto-adjust column widths
-            worksheet = writer.sheets["Metrics"]
-            for idx, col in enumerate(df.columns):
-                max_length = max(
-                    df[col].astype(str).map(len).max(),
-                    len(col)
-                ) + 2
-                worksheet.column_dimensions[chr(65 + idx)].width = max_length
+        # The header comes from the first record's keys, so every record
+        # carries the full column set
+        project = _make_projector(columns)
+        records = [dict(zip(columns, project(record), strict=True)) for record in data]
+        rustpy_xlsxwriter.write_worksheet(
+            records,
+            output_file,
+            sheet_name="Metrics",
+            autofit=False,
+            column_widths=[float(width) for width in widths],
+        )
@@ -0,0 +1,48 @@
+"""Parquet exporter."""
+
+import importlib.util
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+
+class ParquetExporter:
+    """Export metrics to Parquet format."""
+
+    def __init__(self, compression: str = "zstd") -> None:
+        """Initialize the exporter.
+
+        Args:
+            compression: Parquet compression codec passed to pyarrow
+        """
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ImportError(
+                "Parquet export requires the 'pyarrow' package "
+                "(pip install 'bizmetrics-cli[parquet]')"
+            )
+        self.compression = compression
+
+    def export(self, data: list[dict[str, Any]], output_path: Path) -> None:
+        """Export data to Parquet file.
+
+        Records are converted to a columnar Arrow table in C, so no
+        per-row Python code runs on the write path.
+
+        Args:
+            data: List of metric records
+            output_path: Output file path
+        """
+        if not data:
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Union of keys across records, in first-seen order, as in the Excel
+        # exporter. Table.from_pylist would take its columns from the first
+        # record only; inferring a struct array covers every record's keys.
+        columns = list(dict.fromkeys(chain.from_iterable(data)))
+        table = pa.Table.from_struct_array(pa.array(data)).select(columns)
+        pq.write_table(table, output_path, compression=self.compression)
@@ -0,0 +1,75 @@
+"""Tests for CLI commands."""
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from bizmetrics import config
+from bizmetrics.cli import app
+from bizmetrics.config import Settings
+from bizmetrics.db import Database
+
+runner = CliRunner()
+
+
+def _has_ellipsis_row(output: str) -> bool:
+    """Whether the preview table ends with the ``...`` overflow row."""
+    for line in output.splitlines():
+        cells = [cell.strip() for cell in line.split("│")[1:-1]]
+        if cells and all(cell == "..." for cell in cells):
+            return True
+    return False
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the CLI settings at a temporary cache directory."""
+    monkeypatch.setattr(config, "_settings", Settings(cache_dir=tmp_path / "cache"))
+    monkeypatch.setenv("COLUMNS", "200")
+    return tmp_path / "cache"
+
+
+class TestFetch:
+    """Test suite for the fetch command."""
+
+    def test_fetch_demo_caches_records(self, cache_dir: Path) -> None:
+        """Test that fetch reports every record, previews ten and caches them all."""
+        result = runner.invoke(
+            app, ["fetch", "demo", "--start-date", "2024-01-01", "--end-date", "2024-01-14"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Fetched 14 records" in result.output
+        assert "Results cached." in result.output
+        assert _has_ellipsis_row(result.output)
+        with Database(cache_dir / "bizmetrics.db") as db:
+            assert len(db.get_cached_metrics("demo")) == 14
+
+    def test_fetch_demo_no_cache(self, cache_dir: Path) -> None:
+        """Test that --no-cache skips the database entirely."""
+        result = runner.invoke(
+            app,
+            [
+                "fetch",
+                "demo",
+                "--start-date",
+                "2024-01-01",
+                "--end-date",
+                "2024-01-05",
+                "--no-cache",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Fetched 5 records" in result.output
+        assert "Results cached." not in result.output
+        assert not _has_ellipsis_row(result.output)
+        assert not (cache_dir / "bizmetrics.db").exists()
+
+    def test_fetch_unknown_connector(self, cache_dir: Path) -> None:
+        """Test that an unknown connector exits with an error."""
+        result = runner.invoke(app, ["fetch", "nope", "--no-cache"])
+
+        assert result.exit_code == 1
+        assert "Unknown connector: nope" in result.output
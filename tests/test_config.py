@@ -0,0 +1,66 @@
+"""Tests for environment settings."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from bizmetrics.config import ENV_PREFIX, Settings
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Hide BIZMETRICS_* variables from the surrounding environment."""
+    for key in list(os.environ):
+        if key.upper().startswith(ENV_PREFIX):
+            monkeypatch.delenv(key)
+
+
+class TestSettings:
+    """Test suite for Settings.from_env."""
+
+    def test_defaults_without_env(self, tmp_path: Path) -> None:
+        """Test that defaults apply when nothing is configured."""
+        settings = Settings.from_env(tmp_path / ".env")
+
+        assert settings.log_level == "INFO"
+        assert settings.default_format == "csv"
+
+    def test_environment_overrides_env_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that real environment variables win over the .env file."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("BIZMETRICS_LOG_LEVEL=DEBUG\nBIZMETRICS_DEFAULT_FORMAT=excel\n")
+        monkeypatch.setenv("BIZMETRICS_LOG_LEVEL", "ERROR")
+
+        settings = Settings.from_env(env_file)
+
+        assert settings.log_level == "ERROR"
+        assert settings.default_format == "excel"
+
+    def test_env_file_syntax(self, tmp_path: Path) -> None:
+        """Test quoting, the export prefix, comments and case-insensitive keys."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# settings for local runs\n"
+            "\n"
+            "export BIZMETRICS_LOG_LEVEL='WARNING'\n"
+            'bizmetrics_cache_dir="/tmp/cache # not a comment"  # trailing note\n'
+            "BIZMETRICS_LOG_DIR=/tmp/logs  # inline note\n"
+        )
+
+        settings = Settings.from_env(env_file)
+
+        assert settings.log_level == "WARNING"
+        assert settings.cache_dir == Path("/tmp/cache # not a comment")
+        assert settings.log_dir == Path("/tmp/logs")
+
+    def test_invalid_log_level_raises(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unknown log level is rejected."""
+        monkeypatch.setenv("BIZMETRICS_LOG_LEVEL", "VERBOSE")
+
+        with pytest.raises(ValueError, match="log_level"):
+            Settings.from_env(tmp_path / ".env")
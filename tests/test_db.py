@@ -0,0 +1,80 @@
+"""Tests for the SQLite metrics cache."""
+
+import sqlite3
+from pathlib import Path
+
+from bizmetrics.connectors.demo import DemoConnector
+from bizmetrics.db import Database
+
+
+class TestDatabase:
+    """Test suite for Database."""
+
+    def test_cache_roundtrip(self, tmp_path: Path) -> None:
+        """Test that cached records are returned unchanged."""
+        db = Database(tmp_path / "cache.db")
+        data = DemoConnector().fetch(start_date="2024-01-01", end_date="2024-12-31")
+
+        db.cache_metrics("demo", data)
+
+        assert db.get_cached_metrics("demo") == data
+        assert db.get_cached_metrics("meta-ads") == []
+
+    def test_cache_metrics_replaces_previous_entry(self, tmp_path: Path) -> None:
+        """Test that caching a connector again overwrites its single row."""
+        db = Database(tmp_path / "cache.db")
+        db.cache_metrics("demo", [{"date": "2024-01-01"}])
+        db.cache_metrics("demo", [{"date": "2024-01-02"}, {"date": "2024-01-03"}])
+
+        assert len(db.get_cache_stats()) == 1
+        assert db.get_cached_metrics("demo") == [{"date": "2024-01-02"}, {"date": "2024-01-03"}]
+
+    def test_expired_cache_is_ignored(self, tmp_path: Path) -> None:
+        """Test that entries past their TTL are not returned."""
+        db = Database(tmp_path / "cache.db")
+        db.cache_metrics("demo", [{"date": "2024-01-01"}], ttl_hours=-1)
+
+        assert db.get_cached_metrics("demo") == []
+
+    def test_prune_expired(self, tmp_path: Path) -> None:
+        """Test that pruning removes only expired entries."""
+        db = Database(tmp_path / "cache.db")
+        db.cache_metrics("demo", [{"date": "2024-01-01"}])
+        db.cache_metrics("meta-ads", [{"date": "2024-01-01"}], ttl_hours=-1)
+
+        assert db.prune_expired() == 1
+        assert [connector for connector, _, _ in db.get_cache_stats()] == ["demo"]
+
+    def test_cache_stats_use_record_count(self, tmp_path: Path) -> None:
+        """Test that stats report the stored record count per connector."""
+        db = Database(tmp_path / "cache.db")
+        db.cache_metrics("demo", DemoConnector().fetch("2024-01-01", "2024-01-07"))
+
+        stats = db.get_cache_stats()
+
+        assert [(connector, count) for connector, count, _ in stats] == [("demo", 7)]
+
+    def test_legacy_schema_is_rebuilt(self, tmp_path: Path) -> None:
+        """Test that a cache created by an older version is upgraded on open."""
+        db_path = tmp_path / "cache.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE metrics_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    connector TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    expires_at TEXT
+                )
+            """)
+            conn.execute(
+                "INSERT INTO metrics_cache (connector, data, created_at, expires_at) "
+                "VALUES ('demo', '[]', '2024-01-01T00:00:00', '2024-01-02T00:00:00')"
+            )
+        conn.close()
+
+        db = Database(db_path)
+
+        assert db.get_cache_stats() == []
+        db.cache_metrics("demo", [{"date": "2024-01-01", "sessions": 1}])
+        assert db.get_cache_stats()[0][1] == 1
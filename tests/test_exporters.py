@@ -0,0 +1,374 @@
+"""Tests for data exporters."""
+
+import csv
+import subprocess
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from bizmetrics.config import _EXPORT_FORMATS
+from bizmetrics.connectors.demo import DemoConnector
+from bizmetrics.exporters._output import open_threaded
+from bizmetrics.exporters.csv_exporter import CSVExporter
+from bizmetrics.exporters.dispatch import (
+    AUTO_PARQUET_MIN_ROWS,
+    FORMAT_SUFFIXES,
+    export_data,
+    resolve_format,
+)
+from bizmetrics.exporters.excel_exporter import ExcelExporter, _make_projector, _row_values
+from bizmetrics.exporters.parquet_exporter import ParquetExporter
+
+
+class TestCSVExporter:
+    """Test suite for CSVExporter."""
+
+    def test_export_writes_header_and_rows(self, tmp_path: Path) -> None:
+        """Test that every record becomes a CSV row in key order."""
+        data = DemoConnector().fetch(start_date="2024-01-01", end_date="2024-01-07")
+        output = tmp_path / "out" / "report.csv"
+
+        CSVExporter().export(data, output)
+
+        with open(output, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == list(data[0].keys())
+        assert len(rows) == 8
+        assert rows[1][0] == "2024-01-01"
+
+    def test_export_mixed_records_uses_key_union(self, tmp_path: Path) -> None:
+        """Test that records with differing keys share one header and blanks fill gaps."""
+        data = [{"date": "2024-01-01", "sessions": 5}, {"date": "2024-01-02", "clicks": 3}]
+        output = tmp_path / "mixed.csv"
+
+        CSVExporter().export(data, output)
+
+        with open(output, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ["date", "sessions", "clicks"],
+            ["2024-01-01", "5", ""],
+            ["2024-01-02", "", "3"],
+        ]
+
+    def test_export_single_column(self, tmp_path: Path) -> None:
+        """Test that a single-key record set writes one value per row."""
+        output = tmp_path / "single.csv"
+
+        CSVExporter().export([{"date": "2024-01-01"}, {"date": "2024-01-02"}], output)
+
+        assert output.read_text(encoding="utf-8").splitlines() == [
+            "date",
+            "2024-01-01",
+            "2024-01-02",
+        ]
+
+
+def test_dispatch_import_does_not_load_writers() -> None:
+    """Test that importing the dispatcher leaves openpyxl and pyarrow unloaded."""
+    code = (
+        "import sys; import bizmetrics.exporters.dispatch; "
+        "print([m for m in ('openpyxl', 'pyarrow') if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_excel_import_does_not_load_multiprocessing() -> None:
+    """Test that importing the Excel exporter leaves the process pool unloaded."""
+    code = (
+        "import sys; import bizmetrics.exporters.excel_exporter; "
+        "print('concurrent.futures.process' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_open_threaded_writes_in_order(tmp_path: Path) -> None:
+    """Test that the threaded sink writes every block, in order."""
+    output = tmp_path / "blob.bin"
+    blocks = [bytes([i]) * 100_000 for i in range(20)]
+
+    with open_threaded(output, buffer_size=4096) as stream:
+        for block in blocks:
+            stream.write(block)
+        assert stream.tell() == 2_000_000
+
+    assert output.read_bytes() == b"".join(blocks)
+
+
+def test_make_projector_matches_row_values() -> None:
+    """Test that the projector handles missing keys and single columns."""
+    columns = ["date", "sessions", "campaign", "missing"]
+    record = {"date": "2024-01-01", "sessions": 1, "campaign": {"id": "camp_001"}}
+
+    assert _make_projector(columns)(record) == _row_values(record, columns)
+    assert _make_projector(columns[:3])(record) == _row_values(record, columns[:3])
+    assert _make_projector(["sessions"])(record) == [1]
+
+
+@pytest.fixture(params=["openpyxl", "xlsxwriter", "rust"])
+def engine(request: pytest.FixtureRequest) -> str:
+    """Excel engine under test; optional engines are skipped when not installed."""
+    if request.param == "xlsxwriter":
+        pytest.importorskip("xlsxwriter")
+    elif request.param == "rust":
+        pytest.importorskip("rustpy_xlsxwriter")
+    return str(request.param)
+
+
+class TestExcelExporter:
+    """Test suite for ExcelExporter."""
+
+    def test_rust_engine_falls_back_to_openpyxl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a missing rust writer falls back to openpyxl with a warning."""
+        monkeypatch.setattr(
+            "bizmetrics.exporters.excel_exporter.importlib.util.find_spec", lambda name: None
+        )
+
+        with pytest.warns(RuntimeWarning, match="rustpy-xlsxwriter"):
+            exporter = ExcelExporter(engine="rust")
+
+        assert exporter.engine == "openpyxl"
+
+    def test_export_writes_metrics_sheet(self, tmp_path: Path, engine: str) -> None:
+        """Test that records are written to the Metrics sheet."""
+        data = DemoConnector().fetch(start_date="2024-01-01", end_date="2024-01-07")
+        output = tmp_path / "out" / "report.xlsx"
+
+        ExcelExporter(engine=engine).export(data, output)
+
+        sheet = load_workbook(output)["Metrics"]
+        rows = list(sheet.iter_rows(values_only=True))
+        assert list(rows[0]) == list(data[0].keys())
+        assert len(rows) == 8
+        assert list(rows[1]) == list(data[0].values())
+
+    def test_export_sets_column_widths(self, tmp_path: Path) -> None:
+        """Test that column widths fit the longest value plus padding."""
+        data = [{"date": "2024-01-01", "avg_session_duration": 1.5}]
+        output = tmp_path / "report.xlsx"
+
+        ExcelExporter(engine="openpyxl").export(data, output)
+
+        dimensions = load_workbook(output)["Metrics"].column_dimensions
+        assert dimensions["A"].width == len("2024-01-01") + 2
+        assert dimensions["B"].width == len("avg_session_duration") + 2
+
+    def test_export_caps_column_widths(self, tmp_path: Path) -> None:
+        """Test that very long values do not produce oversized columns."""
+        data = [{"campaign_name": "x" * 200}]
+        output = tmp_path / "report.xlsx"
+
+        ExcelExporter(engine="openpyxl").export(data, output)
+
+        dimensions = load_workbook(output)["Metrics"].column_dimensions
+        assert dimensions["A"].width == 50
+
+    def test_export_wide_sheet_column_letters(self, tmp_path: Path) -> None:
+        """Test that widths past column Z land on AA, AB, ..."""
+        data = [{f"metric_{i:02d}": i for i in range(30)}]
+        output = tmp_path / "report.xlsx"
+
+        ExcelExporter(engine="openpyxl").export(data, output)
+
+        dimensions = load_workbook(output)["Metrics"].column_dimensions
+        assert dimensions["AD"].width == len("metric_29") + 2
+
+    def test_export_mixed_records(self, tmp_path: Path, engine: str) -> None:
+        """Test that columns are the union of keys and odd values become text."""
+        data = [
+            {"date": "2024-01-01", "sessions": 10},
+            {"date": "2024-01-02", "campaign": {"id": "camp_001"}},
+        ]
+        output = tmp_path / "report.xlsx"
+
+        ExcelExporter(engine=engine).export(data, output)
+
+        rows = list(load_workbook(output)["Metrics"].iter_rows(values_only=True))
+        assert rows[0] == ("date", "sessions", "campaign")
+        assert rows[1] == ("2024-01-01", 10, None)
+        assert rows[2] == ("2024-01-02", None, "{'id': 'camp_001'}")
+
+    def test_export_nan_and_bytes(self, tmp_path: Path, engine: str) -> None:
+        """Test that NaN/inf do not abort the export and bytes are written as text."""
+        data = [{"bounce_rate": float("nan"), "revenue": float("inf"), "note": b"raw"}]
+        output = tmp_path / "report.xlsx"
+
+        ExcelExporter(engine=engine).export(data, output)
+
+        rows = list(load_workbook(output)["Metrics"].iter_rows(values_only=True))
+        assert rows[1][2] == "raw"
+        # openpyxl leaves the cells blank, xlsxwriter writes Excel error formulas
+        assert rows[1][0] in (None, "=#NUM!")
+        assert rows[1][1] in (None, "=1/0")
+
+    def test_export_date_columns(self, tmp_path: Path, engine: str) -> None:
+        """Test that date and datetime values read back as dates."""
+        data = [
+            {"date": date(2024, 1, 1), "updated_at": datetime(2024, 1, 1, 12, 30)},
+            {"date": date(2024, 1, 2), "updated_at": None},
+        ]
+        output = tmp_path / "report.xlsx"
+
+        ExcelExporter(engine=engine).export(data, output)
+
+        sheet = load_workbook(output)["Metrics"]
+        assert sheet["A2"].value == datetime(2024, 1, 1)
+        assert sheet["A3"].value == datetime(2024, 1, 2)
+        assert sheet["B2"].value == datetime(2024, 1, 1, 12, 30)
+        assert sheet["A2"].is_date
+        # Datetime cells keep the time of day on every engine
+        assert sheet["B2"].number_format in (
+            "yyyy-mm-dd h:mm:ss",
+            "yyyy-mm-dd hh:mm:ss",
+            "yyyy-mm-ddThh:mm:ss",
+        )
+        if engine != "rust":
+            # rust formats dates and datetimes alike
+            assert sheet["A2"].number_format == "yyyy-mm-dd"
+
+    def test_export_beyond_sample_streams_to_disk(self, tmp_path: Path, engine: str) -> None:
+        """Test that parts larger than the width sample are written in full."""
+        data = DemoConnector(seed=1).fetch(start_date="2020-01-01", end_date="2024-12-31")
+        output = tmp_path / "report.xlsx"
+
+        ExcelExporter(engine=engine).export(data, output)
+
+        sheet = load_workbook(output, read_only=True)["Metrics"]
+        assert sum(1 for _ in sheet.iter_rows(values_only=True)) == len(data) + 1
+
+    def test_export_chunked(self, tmp_path: Path, engine: str) -> None:
+        """Test that chunk_size splits the export into numbered parts."""
+        data = DemoConnector().fetch(start_date="2024-01-01", end_date="2024-01-07")
+        output = tmp_path / "report.xlsx"
+
+        written = ExcelExporter(engine=engine).export(data, output, chunk_size=3)
+
+        parts = sorted(p.name for p in tmp_path.iterdir())
+        assert parts == ["report_part001.xlsx", "report_part002.xlsx", "report_part003.xlsx"]
+        assert written == [tmp_path / name for name in parts]
+        last = load_workbook(tmp_path / "report_part003.xlsx")["Metrics"]
+        assert [row[0] for row in last.iter_rows(min_row=2, values_only=True)] == ["2024-01-07"]
+
+    def test_export_iterator_chunked(self, tmp_path: Path, engine: str) -> None:
+        """Test that a generator is streamed into numbered parts."""
+        records = ({"date": f"2024-01-{day:02d}", "sessions": day} for day in range(1, 8))
+        output = tmp_path / "report.xlsx"
+
+        ExcelExporter(engine=engine).export(records, output, chunk_size=5)
+
+        parts = sorted(p.name for p in tmp_path.iterdir())
+        assert parts == ["report_part001.xlsx", "report_part002.xlsx"]
+        first = load_workbook(tmp_path / "report_part001.xlsx")["Metrics"]
+        assert first.max_row == 6
+        last = load_workbook(tmp_path / "report_part002.xlsx")["Metrics"]
+        assert list(last.iter_rows(values_only=True))[0] == ("date", "sessions")
+
+    def test_export_empty_iterator_writes_nothing(self, tmp_path: Path) -> None:
+        """Test that an empty generator creates no file or directory."""
+        output = tmp_path / "out" / "report.xlsx"
+
+        ExcelExporter().export(iter([]), output)
+
+        assert not output.parent.exists()
+
+    def test_export_many(self, tmp_path: Path) -> None:
+        """Test that each job is written to its own workbook."""
+        jobs = [
+            ([{"date": "2024-01-01", "sessions": i}], tmp_path / "out" / f"report_{i}.xlsx")
+            for i in range(3)
+        ]
+
+        ExcelExporter(engine="openpyxl").export_many(jobs, max_workers=2)
+
+        for i in range(3):
+            path = tmp_path / "out" / f"report_{i}.xlsx"
+            rows = list(load_workbook(path)["Metrics"].iter_rows(values_only=True))
+            assert rows[1] == ("2024-01-01", i)
+
+    def test_export_empty_data_writes_nothing(self, tmp_path: Path, engine: str) -> None:
+        """Test that no file is created for empty data."""
+        output = tmp_path / "report.xlsx"
+
+        ExcelExporter(engine=engine).export([], output)
+
+        assert not output.exists()
+
+
+class TestParquetExporter:
+    """Test suite for ParquetExporter."""
+
+    def test_export_roundtrip(self, tmp_path: Path) -> None:
+        """Test that records read back unchanged from the Parquet file."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        data = DemoConnector().fetch(start_date="2024-01-01", end_date="2024-01-07")
+        output = tmp_path / "out" / "report.parquet"
+
+        ParquetExporter().export(data, output)
+
+        assert pq.read_table(output).to_pylist() == data
+
+    def test_export_mixed_records_union_columns(self, tmp_path: Path) -> None:
+        """Test that keys first seen in later records still become columns."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        data = [{"date": "2024-01-01"}, {"date": "2024-01-02", "sessions": 3}]
+        output = tmp_path / "report.parquet"
+
+        ParquetExporter().export(data, output)
+
+        table = pq.read_table(output)
+        assert table.column_names == ["date", "sessions"]
+        assert table.column("sessions").to_pylist() == [None, 3]
+
+
+class TestExportData:
+    """Test suite for the format dispatcher."""
+
+    def test_resolve_format_auto(self) -> None:
+        """Test that auto keeps small exports in Excel."""
+        assert resolve_format("auto", AUTO_PARQUET_MIN_ROWS - 1) == "excel"
+        assert resolve_format("csv", AUTO_PARQUET_MIN_ROWS) == "csv"
+
+    def test_resolve_format_auto_large(self) -> None:
+        """Test that auto sends large exports to Parquet."""
+        pytest.importorskip("pyarrow")
+        assert resolve_format("auto", AUTO_PARQUET_MIN_ROWS) == "parquet"
+
+    def test_export_data_sets_suffix(self, tmp_path: Path) -> None:
+        """Test that the output suffix follows the resolved format."""
+        data = [{"date": "2024-01-01", "sessions": 10}]
+
+        output_files = export_data(data, tmp_path / "report", format="auto")
+
+        assert output_files == [tmp_path / "report.xlsx"]
+        assert output_files[0].exists()
+
+    def test_export_data_reports_split_parts(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a split Excel export returns the part files, not the unsplit name."""
+        monkeypatch.setattr("bizmetrics.exporters.excel_exporter.MAX_EXCEL_ROWS", 2)
+        data = [{"date": f"2024-01-0{day}", "sessions": day} for day in range(1, 4)]
+
+        output_files = export_data(data, tmp_path / "report", format="excel")
+
+        assert output_files == [tmp_path / "report_part001.xlsx", tmp_path / "report_part002.xlsx"]
+        assert all(path.exists() for path in output_files)
+        assert not (tmp_path / "report.xlsx").exists()
+
+    def test_settings_formats_match_dispatcher(self) -> None:
+        """Test that every configurable default format can be exported."""
+        assert set(_EXPORT_FORMATS) == {*FORMAT_SUFFIXES, "auto"}
+
+    def test_export_data_rejects_unknown_format(self, tmp_path: Path) -> None:
+        """Test that unknown formats raise ValueError."""
+        with pytest.raises(ValueError, match="json"):
+            export_data([{"date": "2024-01-01"}], tmp_path / "report", format="json")
@@ -0,0 +1,51 @@
+"""Tests for the CLI entry point."""
+
+import sys
+
+import pytest
+
+from bizmetrics import __main__
+from bizmetrics._version import __version__
+
+
+def _help_commands() -> dict[str, str]:
+    """Command names and summaries listed in the static help text."""
+    section = __main__.HELP_TEXT.split("Commands:\n", 1)[1]
+    return dict(line.split(maxsplit=1) for line in section.splitlines() if line.strip())
+
+
+class TestMain:
+    """Test suite for the fast-path entry point."""
+
+    @pytest.mark.parametrize("flag", ["--version", "-v"])
+    def test_version(
+        self, flag: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that the version flags print the version."""
+        monkeypatch.setattr(sys, "argv", ["bizmetrics", flag])
+
+        __main__.main()
+
+        assert capsys.readouterr().out == f"BizMetrics CLI version {__version__}\n"
+
+    def test_help(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that --help prints the static help text."""
+        monkeypatch.setattr(sys, "argv", ["bizmetrics", "--help"])
+
+        __main__.main()
+
+        assert capsys.readouterr().out == __main__.HELP_TEXT
+
+    def test_help_lists_registered_commands(self) -> None:
+        """Test that the static help lists exactly the commands registered on the app."""
+        from bizmetrics.cli import app
+
+        registered = {}
+        for command in app.registered_commands:
+            assert command.callback is not None
+            name = command.name or command.callback.__name__
+            registered[name] = (command.callback.__doc__ or "").strip().splitlines()[0]
+
+        assert _help_commands() == registered